@@ -3,8 +3,9 @@ from __future__ import annotations
 import sys
 
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import QLocale
+from PySide6.QtCore import QLocale, Qt
 
+from app.services.store_loader import StoreLoader
 from app.services.timer_service import TimerService
 from app.storage.excel_store import ExcelStore
 from app.ui.main_window import MainWindow
@@ -14,11 +15,21 @@ def main() -> int:
     # Force English locale globally (affects standard dialogs/day names)
     QLocale.setDefault(QLocale(QLocale.English, QLocale.UnitedStates))
     app = QApplication(sys.argv)
-    store = ExcelStore()
+    store = ExcelStore(load=False)
     timer = TimerService()
     win = MainWindow(store=store, timer=timer)
     win.show()
-    return app.exec()
+    # Parse the xlsx in the background so the window shows first
+    loader = StoreLoader(store)
+    # emitted from the worker thread; deliver on the GUI thread
+    loader.loaded.connect(win.on_store_loaded, Qt.QueuedConnection)
+    loader.failed.connect(win.on_store_load_failed, Qt.QueuedConnection)
+    loader.start()
+    # Fold the append-only log into the xlsx on exit
+    app.aboutToQuit.connect(store.export_xlsx)
+    code = app.exec()
+    loader.wait()
+    return code
 
 
 if __name__ == "__main__":
@@ -5,7 +5,7 @@ from datetime import date, time, datetime, timedelta
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TimeRecord:
     date: date
     start_time: time
@@ -21,16 +21,17 @@ class TimeRecord:
         end_dt: datetime,
         note: str = "",
     ) -> "TimeRecord":
-        duration: timedelta = end_dt - start_dt
-        total_seconds = int(round(duration.total_seconds()))
-        duration_min = int(round(total_seconds / 60.0))
+        td: timedelta = end_dt - start_dt
+        # Round to seconds/minutes with integer math, no float round trip
+        total_seconds = td.days * 86400 + td.seconds + (1 if td.microseconds >= 500000 else 0)
+        duration_min = (total_seconds + 30) // 60
         return cls(
-            date=start_dt.date(),
-            start_time=start_dt.time().replace(microsecond=0),
-            end_time=end_dt.time().replace(microsecond=0),
-            duration_min=duration_min,
-            duration_sec=total_seconds,
-            note=note or "",
+            start_dt.date(),
+            start_dt.time().replace(microsecond=0),
+            end_dt.time().replace(microsecond=0),
+            duration_min,
+            total_seconds,
+            note or "",
         )
 
     @classmethod
@@ -42,14 +43,14 @@ class TimeRecord:
         note: str = "",
     ) -> "TimeRecord":
         total_seconds = max(int(elapsed_seconds), 0)
-        duration_min = int(round(total_seconds / 60.0))
+        duration_min = (total_seconds + 30) // 60
         return cls(
-            date=start_dt.date(),
-            start_time=start_dt.time().replace(microsecond=0),
-            end_time=end_dt.time().replace(microsecond=0),
-            duration_min=duration_min,
-            duration_sec=total_seconds,
-            note=note or "",
+            start_dt.date(),
+            start_dt.time().replace(microsecond=0),
+            end_dt.time().replace(microsecond=0),
+            duration_min,
+            total_seconds,
+            note or "",
         )
 
 
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from PySide6.QtCore import QThread, Signal
+
+from app.storage.excel_store import ExcelStore
+
+
+class StoreLoader(QThread):
+    """Parses the workbook off the GUI thread so the window paints immediately."""
+
+    loaded = Signal(object)  # List[TimeRecord]
+    failed = Signal(str)  # error message
+
+    def __init__(self, store: ExcelStore, parent=None) -> None:
+        super().__init__(parent)
+        self._store = store
+
+    def run(self) -> None:
+        try:
+            records = self._store.read_workbook_records()
+        except Exception as exc:
+            # Corrupt or locked workbook; report instead of leaving the UI waiting
+            self.failed.emit(str(exc) or type(exc).__name__)
+            return
+        self.loaded.emit(records)
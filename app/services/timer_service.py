@@ -3,7 +3,14 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional, Tuple
 
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QElapsedTimer, QObject, Qt, QTimer, Signal
+
+
+_NS_PER_SEC = 1_000_000_000
+# Zero-padded two-digit strings, built once so ticks skip format parsing
+_PAD2 = tuple(f"{i:02d}" for i in range(100))
+
+_STATE_IDLE, _STATE_RUN, _STATE_PAUSE = 0, 1, 2
 
 
 class TimerService(QObject):
@@ -16,11 +23,15 @@ class TimerService(QObject):
     def __init__(self) -> None:
         super().__init__()
         self._timer = QTimer(self)
-        self._timer.setInterval(100)  # 100ms for tenths rendering
+        self._timer.setInterval(250)  # 4 Hz is enough for the tenths digit
+        self._timer.setTimerType(Qt.CoarseTimer)
         self._timer.timeout.connect(self._on_tick)
+        # monotonic clock for the running segment; ticks only drive the display
+        self._elapsed = QElapsedTimer()
+        self._ticks_enabled: bool = True
+        self._state: int = _STATE_IDLE
         self._first_start_dt: Optional[datetime] = None
-        self._current_start_dt: Optional[datetime] = None
-        self._accumulated_sec: int = 0
+        self._accumulated_ns: int = 0
         self._last_formatted: str = "00:00:00"
 
     @staticmethod
@@ -28,82 +39,86 @@ class TimerService(QObject):
         hours = seconds // 3600
         minutes = (seconds % 3600) // 60
         secs = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        hh = _PAD2[hours] if hours < 100 else str(hours)
+        return hh + ":" + _PAD2[minutes] + ":" + _PAD2[secs]
 
     def is_running(self) -> bool:
-        return self._current_start_dt is not None
+        return self._state == _STATE_RUN
 
     def is_paused(self) -> bool:
-        return (self._first_start_dt is not None) and (self._current_start_dt is None) and (self._accumulated_sec >= 0)
+        return self._state == _STATE_PAUSE
 
     def start(self) -> None:
-        if self.is_running() or self.is_paused():
+        if self._state != _STATE_IDLE:
             return
-        now = datetime.now()
-        self._first_start_dt = now
-        self._current_start_dt = now
-        self._accumulated_sec = 0
-        self._timer.start()
+        self._state = _STATE_RUN
+        self._first_start_dt = datetime.now()
+        self._elapsed.start()
+        self._accumulated_ns = 0
+        self._last_formatted = "00:00:00"
+        self._start_ticks()
         self.started.emit()
         self.tick.emit(0, "00:00:00")
 
     def pause(self) -> None:
-        if not self.is_running():
+        if self._state != _STATE_RUN:
             return
-        assert self._current_start_dt is not None
-        now = datetime.now()
-        self._accumulated_sec += int(round((now - self._current_start_dt).total_seconds()))
-        self._current_start_dt = None
+        self._state = _STATE_PAUSE
+        self._accumulated_ns += self._elapsed.nsecsElapsed()
         self._timer.stop()
         self.paused.emit()
         # keep last tick visible
 
     def resume(self) -> None:
-        if not self.is_paused():
+        if self._state != _STATE_PAUSE:
             return
-        self._current_start_dt = datetime.now()
-        self._timer.start()
+        self._state = _STATE_RUN
+        self._elapsed.start()
+        self._start_ticks()
         self.resumed.emit()
 
     def stop(self) -> Optional[Tuple[datetime, datetime, int]]:
-        if (self._first_start_dt is None) and (self._current_start_dt is None):
+        if self._state == _STATE_IDLE or self._first_start_dt is None:
             return None
-        now = datetime.now()
-        total = self._accumulated_sec
-        if self.is_running():
-            assert self._current_start_dt is not None
-            total += int(round((now - self._current_start_dt).total_seconds()))
-        start_dt = self._first_start_dt or now
-        end_dt = now
+        total = (self._current_elapsed_ns() + _NS_PER_SEC // 2) // _NS_PER_SEC
+        end_dt = datetime.now()
+        start_dt = self._first_start_dt
         # reset state
+        self._state = _STATE_IDLE
         self._first_start_dt = None
-        self._current_start_dt = None
-        self._accumulated_sec = 0
+        self._accumulated_ns = 0
+        self._last_formatted = "00:00:00"
         self._timer.stop()
         self.stopped.emit(int(total))
         self.tick.emit(0, "00:00:00")
         return start_dt, end_dt, int(total)
 
-    def _current_elapsed(self) -> int:
-        if self.is_running():
-            assert self._current_start_dt is not None
-            return self._accumulated_sec + int(round((datetime.now() - self._current_start_dt).total_seconds()))
-        return self._accumulated_sec
-
-    def _current_elapsed_float(self) -> float:
-        if self.is_running():
-            assert self._current_start_dt is not None
-            return self._accumulated_sec + float((datetime.now() - self._current_start_dt).total_seconds())
-        return float(self._accumulated_sec)
+    def set_ticks_enabled(self, enabled: bool) -> None:
+        """Pause display ticks while nothing shows them (elapsed time keeps counting)."""
+        self._ticks_enabled = enabled
+        if not enabled:
+            self._timer.stop()
+        elif self._state == _STATE_RUN and not self._timer.isActive():
+            self._timer.start()
+            self._on_tick()
+
+    def _start_ticks(self) -> None:
+        if self._ticks_enabled:
+            self._timer.start()
+
+    def _current_elapsed_ns(self) -> int:
+        # Elapsed time uses integer monotonic nanoseconds; datetime only stamps start/end
+        if self._state == _STATE_RUN:
+            return self._accumulated_ns + self._elapsed.nsecsElapsed()
+        return self._accumulated_ns
 
     def _on_tick(self) -> None:
-        total = self._current_elapsed_float()
-        seconds_int = int(total)
+        elapsed_ns = self._current_elapsed_ns()
+        seconds_int = elapsed_ns // _NS_PER_SEC
         # tenths
-        tenths = int((total - seconds_int) * 10) % 10
-        base = self._fmt(seconds_int)
-        self._last_formatted = f"{base}.{tenths}"
-        self.tick.emit(seconds_int, self._last_formatted)
-
-
-
+        tenths = (elapsed_ns // 100_000_000) % 10
+        formatted = self._fmt(seconds_int) + "." + "0123456789"[tenths]
+        if formatted == self._last_formatted:
+            return
+        self._last_formatted = formatted
+        self.tick.emit(seconds_int, formatted)
@@ -1,99 +1,346 @@
 from __future__ import annotations
 
-from dataclasses import asdict
+import calendar
+import json
+import os
+from collections import defaultdict
 from datetime import date, datetime, time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import DefaultDict, Dict, List, Optional
 
 from openpyxl import Workbook, load_workbook
 
 from app.models.record import TimeRecord
 
 
+_COLUMNS = ("date", "start_time", "end_time", "duration_sec", "duration_min", "note")
+
+
+@lru_cache(maxsize=256)
+def _month_range(year: int, month: int) -> tuple:
+    return calendar.monthrange(year, month)
+
+
+def _to_date(value) -> date:
+    # 按类型身份判断，常见的字符串走 C 实现的 fromisoformat
+    if type(value) is date:
+        return value
+    if isinstance(value, datetime):
+        # Excel 日期单元格读出来是 datetime
+        return value.date()
+    s = str(value)
+    try:
+        return date.fromisoformat(s)
+    except ValueError:
+        # 不补零的写法（如 2026-1-5）fromisoformat 不接受，回退到 strptime
+        return datetime.strptime(s, "%Y-%m-%d").date()
+
+
+def _to_time(value) -> time:
+    if type(value) is time:
+        return value
+    if isinstance(value, datetime):
+        return value.time()
+    s = str(value)
+    try:
+        return time.fromisoformat(s)
+    except ValueError:
+        # 如 9:00:00
+        return datetime.strptime(s, "%H:%M:%S").time()
+
+
 class ExcelStore:
-    def __init__(self, file_path: Optional[Path] = None) -> None:
+    def __init__(self, file_path: Optional[Path] = None, load: bool = True) -> None:
         self.file_path: Path = Path(file_path) if file_path else Path.cwd() / "time_records.xlsx"
         self.sheet_name: str = "records"
-        self.date_to_records: Dict[date, List[TimeRecord]] = {}
-        self.date_to_total_minutes: Dict[date, int] = {}
+        # 追加日志：每次保存只写一行，xlsx 在 export_xlsx 时统一重建
+        self._log_path: Path = self.file_path.with_suffix(".jsonl")
+        self._pending: List[TimeRecord] = []
+        self.date_to_records: DefaultDict[date, List[TimeRecord]] = defaultdict(list)
+        self.date_to_total_minutes: DefaultDict[date, int] = defaultdict(int)
+        # 每日秒数合计随记录增量维护，统计视图无需再逐条求和
+        self.date_to_total_seconds: DefaultDict[date, int] = defaultdict(int)
+        # load=False 时由调用方在后台线程读取后调用 apply_loaded
+        self.loaded: bool = False
+        # 读取工作簿失败时的错误信息，此时 loaded 保持 False
+        self.load_error: Optional[str] = None
+        # 数据每次变化时递增，视图据此判断缓存的渲染是否过期
+        self.revision: int = 0
         self._ensure_file()
-        self._load_all()
+        if load:
+            self._load_all()
 
     def _ensure_file(self) -> None:
         if not self.file_path.exists():
-            wb = Workbook()
-            ws = wb.active
-            ws.title = self.sheet_name
-            ws.append(["date", "start_time", "end_time", "duration_sec", "duration_min", "note"])
+            # write-only 模式创建新文件，无需构造 Cell 对象
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet(self.sheet_name)
+            ws.append(_COLUMNS)
             wb.save(self.file_path)
             wb.close()
-        else:
-            wb = load_workbook(self.file_path)
-            if self.sheet_name not in wb.sheetnames:
-                ws = wb.create_sheet(self.sheet_name)
-                ws.append(["date", "start_time", "end_time", "duration_sec", "duration_min", "note"])
-                wb.save(self.file_path)
-            else:
-                # 兼容旧文件：若缺少 duration_sec 列则补上
-                ws = wb[self.sheet_name]
-                header = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
-                if header and "duration_sec" not in header:
-                    # 在 duration_min 前或末尾插入一列标题（为简单起见，追加到末尾）
-                    ws.cell(row=1, column=len(header) + 1, value="duration_sec")
-                wb.save(self.file_path)
+            return
+        # 先以只读模式检查，只有确实需要补表/补列时才读写打开并保存
+        wb = load_workbook(self.file_path, read_only=True)
+        try:
+            has_sheet = self.sheet_name in wb.sheetnames
+            header = []
+            if has_sheet:
+                header = list(next(wb[self.sheet_name].iter_rows(min_row=1, max_row=1, values_only=True), ()))
+        finally:
             wb.close()
+        if has_sheet and (not header or "duration_sec" in header):
+            return
+        wb = load_workbook(self.file_path)
+        if not has_sheet:
+            ws = wb.create_sheet(self.sheet_name)
+            ws.append(_COLUMNS)
+        else:
+            # 兼容旧文件：若缺少 duration_sec 列则补上
+            # 在 duration_min 前或末尾插入一列标题（为简单起见，追加到末尾）
+            ws = wb[self.sheet_name]
+            ws.cell(row=1, column=len(header) + 1, value="duration_sec")
+        wb.save(self.file_path)
+        wb.close()
 
     def _load_all(self) -> None:
+        self.apply_loaded(self.read_workbook_records())
+
+    def read_workbook_records(self) -> List[TimeRecord]:
+        """Parse all rows of the workbook.
+
+        Only reads the file and touches no shared state, so it is safe to
+        call from a worker thread.
+        """
+        records: List[TimeRecord] = []
+        # 只读模式流式解析，不保留单元格样式
+        wb = load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            ws = wb[self.sheet_name]
+            # 读取表头映射，支持旧/新列顺序
+            header_cells = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            if not header_cells:
+                # 空表（连表头都没有）视为没有记录
+                return records
+            header = [str(h) if h is not None else "" for h in header_cells]
+            name_to_idx = {name: idx for idx, name in enumerate(header)}
+            # 列位置只解析一次，循环内直接按下标取值
+            i_date = name_to_idx.get("date", -1)
+            i_start = name_to_idx.get("start_time", -1)
+            i_end = name_to_idx.get("end_time", -1)
+            i_min = name_to_idx.get("duration_min", -1)
+            i_sec = name_to_idx.get("duration_sec", -1)
+            i_note = name_to_idx.get("note", -1)
+            width = len(header)
+            for row in ws.iter_rows(min_row=2, values_only=True):
+                if not row:
+                    continue
+                if len(row) < width:
+                    # 没有 <dimension> 的文件在只读模式下短行不会补齐
+                    row = row + (None,) * (width - len(row))
+                # 兼容旧行：缺失的列取默认值
+                d_str = row[i_date] if i_date >= 0 else None
+                start_str = row[i_start] if i_start >= 0 else None
+                end_str = row[i_end] if i_end >= 0 else None
+                duration_min = row[i_min] if i_min >= 0 else None
+                duration_sec = row[i_sec] if i_sec >= 0 else None
+                note = row[i_note] if i_note >= 0 else ""
+                rec = self._parse_row(d_str, start_str, end_str, duration_min, duration_sec, note)
+                if rec is None:
+                    continue
+                records.append(rec)
+        finally:
+            # 只读模式会保持文件句柄，必须显式关闭
+            wb.close()
+        return records
+
+    def apply_loaded(self, records: List[TimeRecord], load_error: Optional[str] = None) -> None:
+        """Rebuild the in-memory indexes from workbook rows plus the log.
+
+        With ``load_error`` the workbook could not be read: only the log is
+        indexed and ``loaded`` stays False, so export_xlsx will not rebuild.
+        """
         self.date_to_records.clear()
         self.date_to_total_minutes.clear()
-        wb = load_workbook(self.file_path)
-        ws = wb[self.sheet_name]
-        # 读取表头映射，支持旧/新列顺序
-        header_cells = next(ws.iter_rows(min_row=1, max_row=1, values_only=True))
-        header = [str(h) if h is not None else "" for h in header_cells]
-        name_to_idx = {name: idx for idx, name in enumerate(header)}
-        for row in ws.iter_rows(min_row=2, values_only=True):
-            if not row:
-                continue
-            # 兼容旧行：从列名安全取值
-            d_str = row[name_to_idx.get("date", -1)] if name_to_idx.get("date", -1) >= 0 else None
-            start_str = row[name_to_idx.get("start_time", -1)] if name_to_idx.get("start_time", -1) >= 0 else None
-            end_str = row[name_to_idx.get("end_time", -1)] if name_to_idx.get("end_time", -1) >= 0 else None
-            duration_min = row[name_to_idx.get("duration_min", -1)] if name_to_idx.get("duration_min", -1) >= 0 else None
-            duration_sec = row[name_to_idx.get("duration_sec", -1)] if name_to_idx.get("duration_sec", -1) >= 0 else None
-            note = row[name_to_idx.get("note", -1)] if name_to_idx.get("note", -1) >= 0 else ""
-            if d_str is None or start_str is None or end_str is None:
-                continue
-            try:
-                d: date = d_str if isinstance(d_str, date) else datetime.strptime(str(d_str), "%Y-%m-%d").date()
-                st: time = (
-                    start_str
-                    if isinstance(start_str, time)
-                    else datetime.strptime(str(start_str), "%H:%M:%S").time()
-                )
-                et: time = (
-                    end_str
-                    if isinstance(end_str, time)
-                    else datetime.strptime(str(end_str), "%H:%M:%S").time()
-                )
-                mins: int = int(duration_min) if duration_min is not None else 0
-                secs: int = int(duration_sec) if duration_sec is not None else int(mins * 60)
-                rec = TimeRecord(date=d, start_time=st, end_time=et, duration_min=mins, duration_sec=secs, note=str(note or ""))
-            except Exception:
-                # skip malformed rows
-                continue
-            self.date_to_records.setdefault(rec.date, []).append(rec)
-            self.date_to_total_minutes[rec.date] = self.date_to_total_minutes.get(rec.date, 0) + rec.duration_min
-        wb.close()
+        self.date_to_total_seconds.clear()
+        for rec in records:
+            self._index_record(rec)
+        # 日志在这里（GUI 线程）重放，加载期间新增的记录也会包含在内
+        self._load_log()
+        self.load_error = load_error
+        self.loaded = load_error is None
+        self.revision += 1
+
+    def _load_log(self) -> None:
+        # 重放尚未并入 xlsx 的日志行
+        self._pending.clear()
+        if not self._log_path.exists():
+            return
+        with self._log_path.open("r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    obj = json.loads(line)
+                except ValueError:
+                    # 崩溃时可能留下半行，忽略
+                    continue
+                if not isinstance(obj, list) or len(obj) != len(_COLUMNS):
+                    continue
+                d_str, start_str, end_str, duration_sec, duration_min, note = obj
+                rec = self._parse_row(d_str, start_str, end_str, duration_min, duration_sec, note)
+                if rec is None:
+                    continue
+                self._pending.append(rec)
+                self._index_record(rec)
+
+    @staticmethod
+    def _parse_row(d_str, start_str, end_str, duration_min, duration_sec, note) -> Optional[TimeRecord]:
+        if d_str is None or start_str is None or end_str is None:
+            return None
+        try:
+            d: date = _to_date(d_str)
+            st: time = _to_time(start_str)
+            et: time = _to_time(end_str)
+            mins: int = int(duration_min) if duration_min is not None else 0
+            secs: int = int(duration_sec) if duration_sec is not None else int(mins * 60)
+            return TimeRecord(d, st, et, mins, secs, str(note or ""))
+        except Exception:
+            # skip malformed rows
+            return None
+
+    def _index_record(self, rec: TimeRecord) -> None:
+        self.date_to_records[rec.date].append(rec)
+        self.date_to_total_minutes[rec.date] += rec.duration_min
+        self.date_to_total_seconds[rec.date] += rec.duration_sec
 
     def get_records_for_date(self, d: date) -> List[TimeRecord]:
-        return list(self.date_to_records.get(d, []))
+        """Records for one day, in insertion order.
+
+        Returns the store's own list (no copy); callers must not mutate it.
+        """
+        return self.date_to_records.get(d, [])
+
+    def get_records_for_week(self, monday: date) -> Dict[date, List[TimeRecord]]:
+        """Records for the 7 days from ``monday``; days without records are omitted.
+
+        Like get_records_for_date, the lists are the store's own.
+        """
+        by_date = self.date_to_records
+        base_ord = monday.toordinal()
+        result: Dict[date, List[TimeRecord]] = {}
+        for i in range(7):
+            d = date.fromordinal(base_ord + i)
+            recs = by_date.get(d)
+            if recs:
+                result[d] = recs
+        return result
 
     def get_total_minutes(self, d: date) -> int:
         return int(self.date_to_total_minutes.get(d, 0))
 
+    def get_daily_totals_for_month(self, year: int, month: int) -> Dict[date, int]:
+        """Seconds per day for one month; days without records are omitted."""
+        totals = self.date_to_total_seconds
+        first_ord = date(year, month, 1).toordinal()
+        result: Dict[date, int] = {}
+        for i in range(_month_range(year, month)[1]):
+            d = date.fromordinal(first_ord + i)
+            secs = totals.get(d)
+            if secs:
+                result[d] = secs
+        return result
+
+    @staticmethod
+    def _record_row(record: TimeRecord) -> tuple:
+        # 与 _COLUMNS 顺序一致
+        return (
+            record.date.isoformat(),
+            record.start_time.isoformat(timespec="seconds"),
+            record.end_time.isoformat(timespec="seconds"),
+            int(record.duration_sec),
+            int(record.duration_min),
+            record.note or "",
+        )
+
+    @classmethod
+    def _row_map(cls, record: TimeRecord) -> Dict[str, object]:
+        return dict(zip(_COLUMNS, cls._record_row(record)))
+
     def add_record(self, record: TimeRecord) -> None:
-        # append to excel
+        # append one line to the log; no workbook parse/serialize on the hot path.
+        # 每行是按 _COLUMNS 顺序的数组，不构造中间 dict
+        line = json.dumps(self._record_row(record), ensure_ascii=False)
+        with self._log_path.open("a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._pending.append(record)
+        # update in-memory indexes
+        self._index_record(record)
+        self.revision += 1
+
+    def export_xlsx(self) -> bool:
+        """Fold pending log entries into the xlsx file.
+
+        Returns False if the workbook could not be written (e.g. it is open
+        in Excel); the log is kept in that case and retried next time.
+        """
+        if not self._pending and not self._log_path.exists():
+            return True
+        if not self.loaded:
+            # 内存中不是完整数据，不能据此重建 xlsx
+            return False
+        tmp_path = self.file_path.with_name(self.file_path.name + ".tmp")
+        try:
+            if self._can_rebuild():
+                self._write_all(tmp_path)
+            else:
+                self._append_pending(tmp_path)
+            os.replace(tmp_path, self.file_path)
+        except OSError:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            return False
+        self._log_path.unlink(missing_ok=True)
+        self._pending.clear()
+        return True
+
+    def _can_rebuild(self) -> bool:
+        # 仅当工作簿只含本表且无自定义列时才走流式复制；
+        # 只写模式不保留其他工作表和单元格样式
+        wb = load_workbook(self.file_path, read_only=True)
+        try:
+            if wb.sheetnames != [self.sheet_name]:
+                return False
+            ws = wb[self.sheet_name]
+            header = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+            return {str(h) for h in header if h is not None} <= set(_COLUMNS)
+        finally:
+            wb.close()
+
+    def _write_all(self, path: Path) -> None:
+        # 现有行按原样逐行复制（含无法解析的行、公式和日期单元格），
+        # 不从内存索引重建，行数和行序都不变；待写记录追加在末尾
+        src = load_workbook(self.file_path, read_only=True)
+        try:
+            rows = src[self.sheet_name].iter_rows(values_only=True)
+            header = list(next(rows, ())) or list(_COLUMNS)
+            if "duration_sec" not in header:
+                header.append("duration_sec")
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet(self.sheet_name)
+            ws.append(header)
+            for row in rows:
+                ws.append(row)
+            self._append_rows(ws, header)
+            wb.save(path)
+            wb.close()
+        finally:
+            src.close()
+
+    def _append_pending(self, path: Path) -> None:
         wb = load_workbook(self.file_path)
         ws = wb[self.sheet_name]
         # 确保包含 duration_sec 列；若无则追加表头列
@@ -101,22 +348,16 @@ class ExcelStore:
         if "duration_sec" not in header:
             ws.cell(row=1, column=len(header) + 1, value="duration_sec")
             header.append("duration_sec")
-        # 以当前表头顺序写入一行，未知列留空
-        row_data_map = {
-            "date": record.date.strftime("%Y-%m-%d"),
-            "start_time": record.start_time.strftime("%H:%M:%S"),
-            "end_time": record.end_time.strftime("%H:%M:%S"),
-            "duration_sec": int(record.duration_sec),
-            "duration_min": int(record.duration_min),
-            "note": record.note or "",
-        }
-        row_to_write = [row_data_map.get(str(col_name), "") for col_name in header]
-        ws.append(row_to_write)
-        wb.save(self.file_path)
+        self._append_rows(ws, header)
+        wb.save(path)
         wb.close()
-        # update in-memory indexes
-        self.date_to_records.setdefault(record.date, []).append(record)
-        self.date_to_total_minutes[record.date] = self.date_to_total_minutes.get(record.date, 0) + record.duration_min
-
-
 
+    def _append_rows(self, ws, header: List[object]) -> None:
+        if tuple(header) == _COLUMNS:
+            for rec in self._pending:
+                ws.append(self._record_row(rec))
+        else:
+            for rec in self._pending:
+                # 以当前表头顺序写入一行，未知列留空
+                row_data_map = self._row_map(rec)
+                ws.append([row_data_map.get(str(col_name), "") for col_name in header])
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import date, time as dt_time
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from PySide6.QtCore import Qt, QDate, QTime
+from PySide6.QtCore import Qt, QDate, QTime, Slot
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -17,13 +17,20 @@ from PySide6.QtWidgets import (
     QDateEdit,
     QTimeEdit,
     QMessageBox,
+    QStatusBar,
 )
 
 from app.models.record import TimeRecord
 from app.services.timer_service import TimerService
 from app.storage.excel_store import ExcelStore
 from app.views.timer_display import TimerDisplay
-from app.views.stats_view import StatsView
+
+if TYPE_CHECKING:
+    from app.views.stats_view import StatsView
+
+
+def _sec_to_time(sec: int) -> dt_time:
+    return dt_time(sec // 3600, sec // 60 % 60, sec % 60)
 
 
 class NoteDialog(QDialog):
@@ -40,7 +47,12 @@ class NoteDialog(QDialog):
         layout.addWidget(self._buttons)
         self.setLayout(layout)
 
+    def reset(self) -> None:
+        self._edit.clear()
+        self._edit.setFocus()
+
     def get_text(self) -> Optional[str]:
+        self.reset()
         if self.exec() == QDialog.Accepted:
             return self._edit.toPlainText().strip()
         return None
@@ -52,19 +64,14 @@ class ManualRecordDialog(QDialog):
         self.setWindowTitle("Manual Record")
         self.resize(420, 320)
 
-        today = QDate.currentDate()
-        now_time_obj = QTime.currentTime()
-        now_time = QTime(now_time_obj.hour(), now_time_obj.minute(), 0)
-        default_end = now_time.addSecs(3600)  # +1h
-
-        self._date_edit = QDateEdit(today, self)
+        self._date_edit = QDateEdit(self)
         self._date_edit.setCalendarPopup(True)
         self._date_edit.setDisplayFormat("yyyy-MM-dd")
 
-        self._start_edit = QTimeEdit(now_time, self)
+        self._start_edit = QTimeEdit(self)
         self._start_edit.setDisplayFormat("HH:mm:ss")
 
-        self._end_edit = QTimeEdit(default_end, self)
+        self._end_edit = QTimeEdit(self)
         self._end_edit.setDisplayFormat("HH:mm:ss")
 
         self._duration_edit = QTimeEdit(QTime(1, 0, 0), self)
@@ -92,24 +99,48 @@ class ManualRecordDialog(QDialog):
         layout.addWidget(self._buttons)
         self.setLayout(layout)
 
+        # Last values seen by _update_duration_from_times, reused on accept
+        self._cached_start: dt_time = dt_time(0, 0, 0)
+        self._cached_end: dt_time = dt_time(0, 0, 0)
+        self._cached_diff: int = 0
+
         self._start_edit.timeChanged.connect(self._update_duration_from_times)
         self._end_edit.timeChanged.connect(self._update_duration_from_times)
+        self.reset()
 
+    def reset(self) -> None:
+        # Defaults: today, starting now (whole minute), one hour long
+        now_time_obj = QTime.currentTime()
+        now_time = QTime(now_time_obj.hour(), now_time_obj.minute(), 0)
+        self._date_edit.setDate(QDate.currentDate())
+        self._start_edit.setTime(now_time)
+        self._end_edit.setTime(now_time.addSecs(3600))  # +1h
+        self._update_duration_from_times()
+        self._note_edit.clear()
+        self._msg_label.setText("")
+
+    @Slot()
     def _update_duration_from_times(self) -> None:
-        start = self._start_edit.time()
-        end = self._end_edit.time()
-        start_sec = start.hour() * 3600 + start.minute() * 60 + start.second()
-        end_sec = end.hour() * 3600 + end.minute() * 60 + end.second()
+        # One Qt call per edit instead of hour()/minute()/second()
+        start_sec = self._start_edit.time().msecsSinceStartOfDay() // 1000
+        end_sec = self._end_edit.time().msecsSinceStartOfDay() // 1000
         diff = max(end_sec - start_sec, 0)
-        h = diff // 3600
-        m = (diff % 3600) // 60
-        s = diff % 60
-        self._duration_edit.setTime(QTime(h % 24, m, s))
+        self._cached_start = _sec_to_time(start_sec)
+        self._cached_end = _sec_to_time(end_sec)
+        self._cached_diff = diff
+        # Nothing listens to the duration editor; skip unchanged values and
+        # keep the programmatic set from emitting timeChanged
+        shown = diff % 86400
+        if self._duration_edit.time().msecsSinceStartOfDay() != shown * 1000:
+            self._duration_edit.blockSignals(True)
+            self._duration_edit.setTime(QTime.fromMSecsSinceStartOfDay(shown * 1000))
+            self._duration_edit.blockSignals(False)
         if diff <= 0:
             self._msg_label.setText("End time must be after start time.")
         else:
             self._msg_label.setText("")
 
+    @Slot()
     def _on_accept(self) -> None:
         record = self._build_record()
         if record is None:
@@ -119,23 +150,21 @@ class ManualRecordDialog(QDialog):
         self.accept()
 
     def _build_record(self) -> Optional[TimeRecord]:
-        start = self._start_edit.time()
-        end = self._end_edit.time()
-        start_sec = start.hour() * 3600 + start.minute() * 60 + start.second()
-        end_sec = end.hour() * 3600 + end.minute() * 60 + end.second()
-        diff = end_sec - start_sec
+        # Times were already read when they last changed
+        diff = self._cached_diff
         if diff <= 0:
             return None
         d = self._date_edit.date().toPython()
-        st = dt_time(start.hour(), start.minute(), start.second())
-        et = dt_time(end.hour(), end.minute(), end.second())
+        st = self._cached_start
+        et = self._cached_end
         duration_sec = diff
-        duration_min = int(round(duration_sec / 60.0))
+        duration_min = (duration_sec + 30) // 60
         note = self._note_edit.toPlainText().strip()
-        return TimeRecord(date=d, start_time=st, end_time=et, duration_min=duration_min, duration_sec=duration_sec, note=note)
+        return TimeRecord(d, st, et, duration_min, duration_sec, note)
 
     def get_record(self) -> Optional[TimeRecord]:
         self._result_record: Optional[TimeRecord] = None
+        self.reset()
         if self.exec() == QDialog.Accepted:
             return getattr(self, "_result_record", None)
         return None
@@ -148,6 +177,8 @@ class MainWindow(QMainWindow):
         self.resize(450, 500) 
         self._store = store
         self._timer = timer
+        # The clock shows whole seconds; ticks within the same second need no redraw
+        self._last_tick_seconds: int = -1
 
         # --- Central stacked views ---
         self._stack = QStackedWidget(self)
@@ -159,25 +190,29 @@ class MainWindow(QMainWindow):
         layout.setContentsMargins(0, 0, 0, 0) # Full bleed
         layout.addWidget(self._stack)
         self.setCentralWidget(central)
+        # Created on first message (statusBar() would add it right away)
+        self._status_bar: Optional[QStatusBar] = None
 
-        # Views
+        # Views (stats view is built on first visit)
         self._timer_view = TimerDisplay(self)
-        self._stats_view = StatsView(self._store, self)
+        self._stats_view: Optional[StatsView] = None
+        # Dialogs are built on first use and reused afterwards
+        self._note_dialog: Optional[NoteDialog] = None
+        self._manual_dialog: Optional[ManualRecordDialog] = None
         
         self._stack.addWidget(self._timer_view)
-        self._stack.addWidget(self._stats_view)
         
         # Default to Timer View
         self._show_timer_view()
 
         # --- Wiring ---
         
-        # Timer Service Events
-        self._timer.tick.connect(self._on_tick_timer_view)
-        self._timer.started.connect(self._on_started)
-        self._timer.paused.connect(self._on_paused)
-        self._timer.resumed.connect(self._on_resumed)
-        self._timer.stopped.connect(self._on_stopped)
+        # Timer Service Events (service lives in the GUI thread, call slots directly)
+        self._timer.tick.connect(self._on_tick_timer_view, Qt.DirectConnection)
+        self._timer.started.connect(self._on_started, Qt.DirectConnection)
+        self._timer.paused.connect(self._on_paused, Qt.DirectConnection)
+        self._timer.resumed.connect(self._on_resumed, Qt.DirectConnection)
+        self._timer.stopped.connect(self._on_stopped, Qt.DirectConnection)
 
         # Timer View Events
         self._timer_view.start_requested.connect(self._on_start_clicked)
@@ -185,34 +220,83 @@ class MainWindow(QMainWindow):
         self._timer_view.stop_requested.connect(self._on_record_clicked)
         self._timer_view.stats_requested.connect(self._show_stats_view)
         self._timer_view.manual_requested.connect(self._on_manual_record)
-        
-        # Stats View Events
-        self._stats_view.controls_requested.connect(self._show_timer_view)
 
         # Initial state
         self._sync_buttons()
 
+    @Slot(object)
+    def on_store_loaded(self, records: List[TimeRecord]) -> None:
+        self._store.apply_loaded(records)
+        if self._stats_view is not None:
+            self._stats_view.refresh()
+
+    @Slot(str)
+    def on_store_load_failed(self, message: str) -> None:
+        # Still show what the log holds; the workbook stays untouched on exit
+        self._store.apply_loaded([], load_error=message)
+        if self._stats_view is not None:
+            self._stats_view.refresh()
+        QMessageBox.warning(
+            self,
+            "Could not read records",
+            f"{self._store.file_path}\n\n{message}\n\n"
+            "Only records saved since the last export are shown. New records are still saved.",
+        )
+
+    def showEvent(self, event):
+        # Includes restoring from minimized; only tick if the clock is on screen
+        self._timer.set_ticks_enabled(self._stack.currentWidget() is self._timer_view)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        # Also delivered when the window is minimized
+        self._timer.set_ticks_enabled(False)
+        super().hideEvent(event)
+
+    @Slot()
     def _show_timer_view(self):
         self._stack.setCurrentWidget(self._timer_view)
+        self._timer.set_ticks_enabled(True)
         
+    @Slot()
     def _show_stats_view(self):
-        # Refresh stats when entering view
-        self._stats_view.refresh()
+        if self._stats_view is None:
+            # Deferred import keeps the stats widgets off the startup path
+            from app.views.stats_view import StatsView
+
+            # The constructor already loads the current week
+            self._stats_view = StatsView(self._store, self)
+            self._stats_view.controls_requested.connect(self._show_timer_view)
+            self._stack.addWidget(self._stats_view)
+        else:
+            # Refresh stats when entering view
+            self._stats_view.refresh()
         self._stack.setCurrentWidget(self._stats_view)
+        self._timer.set_ticks_enabled(False)
 
+    @Slot(int, str)
     def _on_tick_timer_view(self, seconds: int, formatted: str) -> None:
+        if seconds == self._last_tick_seconds:
+            return
+        self._last_tick_seconds = seconds
         self._timer_view.update_time(formatted)
 
+    @Slot()
     def _on_started(self) -> None:
         self._sync_buttons()
 
+    @Slot()
     def _on_paused(self) -> None:
         self._sync_buttons()
 
+    @Slot()
     def _on_resumed(self) -> None:
         self._sync_buttons()
 
+    @Slot(int)
     def _on_stopped(self, seconds: int) -> None:
+        # Next session starts from a clean cache so its first tick always renders
+        self._last_tick_seconds = -1
         self._sync_buttons()
 
     def _sync_buttons(self) -> None:
@@ -222,16 +306,17 @@ class MainWindow(QMainWindow):
         # Update Timer View UI
         self._timer_view.set_running_state(running, paused)
 
+    @Slot()
     def _on_start_clicked(self) -> None:
         self._timer.start()
 
+    @Slot()
     def _on_record_clicked(self) -> None:
         res = self._timer.stop()
         if not res:
             return
         start_dt, end_dt, elapsed_sec = res
-        dlg = NoteDialog(self)
-        note = dlg.get_text()
+        note = self._get_note_dialog().get_text()
         if note is None:
             # user canceled; ignore and do not store
             return
@@ -239,21 +324,37 @@ class MainWindow(QMainWindow):
         self._store.add_record(record)
         
         # refresh views if needed (StatsView refreshes on show)
-        self.statusBar().showMessage(f"Recorded {record.duration_min} min", 3000)
+        self._status().showMessage(f"Recorded {record.duration_min} min", 3000)
         
         # If we were in timer view, reset
         self._timer_view.update_time("00:00:00")
 
+    @Slot()
     def _on_manual_record(self) -> None:
-        dlg = ManualRecordDialog(self)
-        record = dlg.get_record()
+        record = self._get_manual_dialog().get_record()
         if record is None:
             return
         self._store.add_record(record)
-        if self._stack.currentWidget() is self._stats_view:
+        if self._stats_view is not None and self._stack.currentWidget() is self._stats_view:
             self._stats_view.refresh()
-        self.statusBar().showMessage(f"Manually recorded {record.duration_min} min", 3000)
+        self._status().showMessage(f"Manually recorded {record.duration_min} min", 3000)
+
+    def _status(self) -> QStatusBar:
+        if self._status_bar is None:
+            self._status_bar = self.statusBar()
+        return self._status_bar
+
+    def _get_note_dialog(self) -> NoteDialog:
+        if self._note_dialog is None:
+            self._note_dialog = NoteDialog(self)
+        return self._note_dialog
+
+    def _get_manual_dialog(self) -> ManualRecordDialog:
+        if self._manual_dialog is None:
+            self._manual_dialog = ManualRecordDialog(self)
+        return self._manual_dialog
 
+    @Slot()
     def _on_pause_clicked(self) -> None:
         if self._timer.is_running():
             self._timer.pause()
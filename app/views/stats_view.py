@@ -1,18 +1,104 @@
 from __future__ import annotations
 
+import calendar
+from bisect import bisect_right
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, time
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QFrame, QStackedWidget, QGridLayout, QSpacerItem, QSizePolicy,
-    QDialog, QTableWidget, QTableWidgetItem, QHeaderView
+    QDialog, QTableView, QHeaderView
 )
-from PySide6.QtCore import Qt, Signal, QSize, QPoint
-from PySide6.QtGui import QColor, QMouseEvent
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QPoint, QRectF, QAbstractTableModel, QModelIndex, QTimer
+from PySide6.QtGui import QBrush, QColor, QFont, QMouseEvent, QPainter, QPen
 
 from app.models.record import TimeRecord
 
+
+_WEEKDAY_ABBR = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+# Week grid rows: (name, start hour, end hour)
+_PERIODS = (("Morning", 0, 12), ("Afternoon", 12, 18), ("Evening", 18, 24))
+# "Mon Morning" ... indexed [day][period]
+_BLOCK_LABELS = tuple(tuple(f"{day} {p[0]}" for p in _PERIODS) for day in _WEEKDAY_ABBR)
+
+# Heatmap palette (light theme): level 0 is gray for no time, 1-6 are green
+# gradients (green-200..700). Thresholds are upper bounds in seconds; bisect
+# picks the bucket. The month grid tops out at level 5.
+_LEVEL_COLORS = ("#e5e7eb", "#bbf7d0", "#86efac", "#4ade80", "#22c55e", "#16a34a", "#15803d")
+_WEEK_THRESHOLDS = (1800, 3600, 7200, 10800, 14400)  # 0.5h, 1h, 2h, 3h, 4h
+_MONTH_THRESHOLDS = (3600, 10800, 18000, 25200)  # 1h, 3h, 5h, 7h
+# Parsed once; paintEvent only indexes into these
+_LEVEL_BRUSHES = tuple(QBrush(QColor(c)) for c in _LEVEL_COLORS)
+_HOVER_PEN = QPen(QColor("white"))
+
+# Day number drawn in the corner of month cells (rgba(0,0,0,0.55))
+_CORNER_TEXT_COLOR = QColor(0, 0, 0, 140)
+
+
+@lru_cache(maxsize=256)
+def _month_cal(year: int, month: int) -> Tuple[Tuple[int, ...], ...]:
+    # Pure function of (year, month); navigation revisits the same months
+    return tuple(tuple(week) for week in calendar.monthcalendar(year, month))
+
+
+@lru_cache(maxsize=2048)
+def _hm(hour: int, minute: int) -> str:
+    return f"{hour:02d}:{minute:02d}"
+
+
+@lru_cache(maxsize=1024)
+def _fmt_short(d: date) -> str:
+    # "Jan 05"; week boundaries and month days repeat across navigations
+    return d.strftime("%b %d")
+
+
+@lru_cache(maxsize=4096)
+def _fmt_time(seconds: int) -> str:
+    # Shared "Xh Ym" formatter; totals repeat a lot across navigations
+    h = seconds // 3600
+    m = (seconds % 3600) // 60
+    return f"{h}h {m}m"
+
+
+class RecordsModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of TimeRecords.
+    """
+    _HEADERS = ("Start", "End", "Duration", "Note")
+
+    def __init__(self, records: List[TimeRecord], parent=None):
+        super().__init__(parent)
+        self._records = records
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._records)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        # Cells are formatted on demand, only for rows the view paints
+        r = self._records[index.row()]
+        col = index.column()
+        if col == 0:
+            return _hm(r.start_time.hour, r.start_time.minute)
+        if col == 1:
+            return _hm(r.end_time.hour, r.end_time.minute)
+        if col == 2:
+            return f"{r.duration_min}m"
+        return r.note
+
+
 class RecordListDialog(QDialog):
     """
     Displays a list of TimeRecords in a simple table.
@@ -27,19 +113,12 @@ class RecordListDialog(QDialog):
         if not records:
             layout.addWidget(QLabel("No records found.", alignment=Qt.AlignCenter))
         else:
-            table = QTableWidget(len(records), 4) # Start, End, Duration, Note
-            table.setHorizontalHeaderLabels(["Start", "End", "Duration", "Note"])
+            table = QTableView(self)
+            table.setModel(RecordsModel(records, table))
             table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
             table.verticalHeader().setVisible(False)
-            table.setSelectionBehavior(QTableWidget.SelectRows)
-            table.setEditTriggers(QTableWidget.NoEditTriggers)
-            
-            for r_idx, r in enumerate(records):
-                dur_str = f"{r.duration_min}m"
-                table.setItem(r_idx, 0, QTableWidgetItem(r.start_time.strftime("%H:%M")))
-                table.setItem(r_idx, 1, QTableWidgetItem(r.end_time.strftime("%H:%M")))
-                table.setItem(r_idx, 2, QTableWidgetItem(dur_str))
-                table.setItem(r_idx, 3, QTableWidgetItem(r.note))
+            table.setSelectionBehavior(QTableView.SelectRows)
+            table.setEditTriggers(QTableView.NoEditTriggers)
                 
             layout.addWidget(table)
         
@@ -48,37 +127,129 @@ class RecordListDialog(QDialog):
         layout.addWidget(btn_close)
 
 
-class HeatmapBlock(QFrame):
+@dataclass(slots=True)
+class _Cell:
+    label: str = ""
+    seconds: int = 0
+    level: int = 0
+    # None hides the cell (e.g. month days outside the month)
+    date: Optional[date] = None
+    period_idx: Optional[int] = None
+    # Small text painted in the top-left corner (month day number)
+    corner_text: str = ""
+
+
+class HeatmapCanvas(QWidget):
     """
-    A single block in the heatmap (representing a time slot or a day).
+    Paints a rows x cols grid of heatmap cells on a single widget.
+
+    Cells share the column width of the widget; a fixed cell_width centers a
+    narrower cell in its column. Hover and clicks are mapped to cells from
+    the mouse position.
     """
     hovered = Signal(str, int) # label_text, seconds
-    clicked = Signal()
-    
-    def __init__(self, label: str, seconds: int, color: str, parent=None):
+    clicked = Signal(object, object) # date, period_idx (None for a whole day)
+    # Shared by all canvases; built on first paint since QFont needs a QApplication
+    _corner_font: Optional[QFont] = None
+
+    def __init__(self, rows: int, cols: int, cell_height: int, cell_width: int = 0, spacing: int = 4, parent=None):
         super().__init__(parent)
-        self.label = label
-        self.seconds = seconds
-        self.default_color = color
-        
-        self.setStyleSheet(f"""
-            HeatmapBlock {{
-                background-color: {color};
-                border-radius: 4px;
-            }}
-            HeatmapBlock:hover {{
-                border: 1px solid white;
-            }}
-        """)
-        self.setCursor(Qt.PointingHandCursor)
-        
-    def enterEvent(self, event):
-        self.hovered.emit(self.label, self.seconds)
-        super().enterEvent(event)
-        
+        self._cols = cols
+        self._cell_w = cell_width
+        self._cell_h = cell_height
+        self._spacing = spacing
+        self._cells: List[_Cell] = []
+        self._hover_idx: Optional[int] = None
+        self.set_rows(rows)
+        self.setMouseTracking(True)
+
+    def cell(self, idx: int) -> _Cell:
+        return self._cells[idx]
+
+    def set_rows(self, rows: int) -> None:
+        if rows == len(self._cells) // self._cols:
+            return
+        self._hover_idx = None
+        del self._cells[rows * self._cols:]
+        while len(self._cells) < rows * self._cols:
+            self._cells.append(_Cell())
+        self.setFixedHeight(rows * self._cell_h + max(rows - 1, 0) * self._spacing)
+
+    def sizeHint(self):
+        col_w = self._cell_w or self._cell_h
+        return QSize(self._cols * col_w + (self._cols - 1) * self._spacing, self.height())
+
+    def _col_width(self) -> float:
+        return (self.width() - (self._cols - 1) * self._spacing) / self._cols
+
+    def _cell_rect(self, idx: int) -> QRectF:
+        row, col = divmod(idx, self._cols)
+        col_w = self._col_width()
+        w = self._cell_w or col_w
+        x = col * (col_w + self._spacing) + (col_w - w) / 2
+        return QRectF(x, row * (self._cell_h + self._spacing), w, self._cell_h)
+
+    def _cell_at(self, pos) -> Optional[int]:
+        col = int(pos.x() // (self._col_width() + self._spacing))
+        row = int(pos.y() // (self._cell_h + self._spacing))
+        if not (0 <= col < self._cols and 0 <= row < len(self._cells) // self._cols):
+            return None
+        idx = row * self._cols + col
+        if self._cells[idx].date is None or not self._cell_rect(idx).contains(pos):
+            return None
+        return idx
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        for idx, cell in enumerate(self._cells):
+            if cell.date is None:
+                continue
+            rect = self._cell_rect(idx)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(_LEVEL_BRUSHES[cell.level])
+            painter.drawRoundedRect(rect, 4, 4)
+            if idx == self._hover_idx:
+                painter.setPen(_HOVER_PEN)
+                painter.setBrush(Qt.NoBrush)
+                painter.drawRoundedRect(rect.adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+            if cell.corner_text:
+                font = HeatmapCanvas._corner_font
+                if font is None:
+                    font = QFont(self.font())
+                    font.setPixelSize(10)
+                    HeatmapCanvas._corner_font = font
+                painter.setFont(font)
+                painter.setPen(_CORNER_TEXT_COLOR)
+                painter.drawText(rect.adjusted(4, 2, 0, 0), Qt.AlignLeft | Qt.AlignTop, cell.corner_text)
+        painter.end()
+
+    def _set_hover(self, idx: Optional[int]) -> None:
+        if idx == self._hover_idx:
+            return
+        self._hover_idx = idx
+        if idx is None:
+            self.unsetCursor()
+        else:
+            self.setCursor(Qt.PointingHandCursor)
+            cell = self._cells[idx]
+            self.hovered.emit(cell.label, cell.seconds)
+        self.update()
+
+    def mouseMoveEvent(self, event):
+        self._set_hover(self._cell_at(event.position()))
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        self._set_hover(None)
+        super().leaveEvent(event)
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            self.clicked.emit()
+            idx = self._cell_at(event.position())
+            if idx is not None:
+                cell = self._cells[idx]
+                self.clicked.emit(cell.date, cell.period_idx)
         super().mousePressEvent(event)
 
 class WeekGrid(QWidget):
@@ -95,110 +266,128 @@ class WeekGrid(QWidget):
         
         # Data storage
         self.total_week_seconds = 0
+        # (date, period_idx) -> records overlapping that period, filled by update_data
+        self._period_records: Dict[Tuple[date, int], List[TimeRecord]] = {}
+
+        # All 3x7 period cells are painted by one canvas; cells carry their
+        # own label, date and period
+        self._canvas = HeatmapCanvas(len(_PERIODS), 7, cell_height=60)
+        for col in range(7):
+            for row, block_label in enumerate(_BLOCK_LABELS[col]):
+                cell = self._canvas.cell(row * 7 + col)
+                cell.label = block_label
+                cell.period_idx = row
+        self._canvas.hovered.connect(self._on_block_hover)
+        self._canvas.clicked.connect(self.request_records)
+        self.layout.addWidget(self._canvas, 0, 0, 1, 7)
+
+        self._day_labels: List[HoverLabel] = []
+        for col, day_name in enumerate(_WEEKDAY_ABBR):
+            # Day Label (Bottom) - Hoverable for day total
+            day_label_widget = HoverLabel(day_name, 0, "Day Total")
+            day_label_widget.hovered.connect(self._on_block_hover)
+            day_label_widget.clicked.connect(self.request_records)
+            self.layout.addWidget(day_label_widget, 1, col)
+            self.layout.setColumnStretch(col, 1)
+            self._day_labels.append(day_label_widget)
+        # Keep the labels right under the canvas when there is spare height
+        self.layout.setRowStretch(2, 1)
+        # enable mouse tracking to receive leaveEvent
+        self.setMouseTracking(True)
         
     def update_data(self, monday: date, records_map: Dict[date, List[TimeRecord]]):
-        # Clear existing
-        for i in reversed(range(self.layout.count())):
-            w = self.layout.itemAt(i).widget()
-            if w: w.setParent(None)
-            
-        days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        periods = [
-            ("Morning", 0, 12),
-            ("Afternoon", 12, 18),
-            ("Evening", 18, 24)
-        ]
-        
+        # Batch all cell changes into a single repaint
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
         self.total_week_seconds = 0
+        self._period_records = {}
         
-        # 7 Columns (Days)
-        for col, day_name in enumerate(days):
-            current_date = monday + timedelta(days=col)
+        # 7 Columns (Days); step by ordinal instead of building timedeltas
+        base_ord = monday.toordinal()
+        for col in range(7):
+            current_date = date.fromordinal(base_ord + col)
+            self._day_labels[col].date = current_date
             day_records = records_map.get(current_date, [])
             
-            # Calculate daily total
-            day_total = sum(r.duration_sec for r in day_records)
-            self.total_week_seconds += day_total
-            
-            # Create Day Label (Bottom) - Hoverable for day total
-            # Now distinct logic inside HoverLabel to handle clicks
-            day_label_widget = HoverLabel(days[col], day_total, "Day Total")
-            day_label_widget.hovered.connect(self._on_block_hover)
-            # Bind current_date
-            day_label_widget.clicked.connect(lambda d=current_date: self.request_records.emit(d, None))
-            
-            self.layout.addWidget(day_label_widget, 3, col)
-            
+            # Daily total and period split in a single pass over the records
+            day_total = 0
             period_seconds_map = {0: 0, 1: 0, 2: 0}
+            buckets: Tuple[List[TimeRecord], ...] = ([], [], [])
             
             for rec in day_records:
+                day_total += rec.duration_sec
                 s = rec.start_time.hour + rec.start_time.minute/60.0
                 e = rec.end_time.hour + rec.end_time.minute/60.0
                 if e < s: e = 24.0 
                 
                 duration = rec.duration_sec
                 
-                def intersect(r_start, r_end, p_start, p_end):
-                    return max(0, min(r_end, p_end) - max(r_start, p_start))
-                
                 full_dur_h = e - s
                 if full_dur_h <= 0: continue
                 
-                for p_idx, (_, p_start, p_end) in enumerate(periods):
-                    h_overlap = intersect(s, e, p_start, p_end)
+                # Periods are fixed (0-12, 12-18, 18-24): most records sit in
+                # one of them, otherwise split by clamped overlap
+                if e <= 12:
+                    period_seconds_map[0] += duration
+                    buckets[0].append(rec)
+                    continue
+                if s >= 18:
+                    period_seconds_map[2] += duration
+                    buckets[2].append(rec)
+                    continue
+                if s >= 12 and e <= 18:
+                    period_seconds_map[1] += duration
+                    buckets[1].append(rec)
+                    continue
+                overlaps = (min(e, 12) - s, min(e, 18) - max(s, 12), e - max(s, 18))
+                for p_idx, h_overlap in enumerate(overlaps):
                     if h_overlap > 0:
-                        ratio = h_overlap / full_dur_h
-                        period_seconds_map[p_idx] += int(duration * ratio)
+                        period_seconds_map[p_idx] += int(duration * h_overlap / full_dur_h)
+                        buckets[p_idx].append(rec)
 
-            # Draw blocks
-            for row, (p_name, _, _) in enumerate(periods):
-                secs = period_seconds_map[row]
-                color = self._get_color(secs, row) 
-                
-                block_label = f"{day_name} {p_name}"
-                block = HeatmapBlock(block_label, secs, color)
-                block.hovered.connect(self._on_block_hover)
-                # Pass date and row (period_idx)
-                block.clicked.connect(lambda d=current_date, p=row: self.request_records.emit(d, p))
-                block.setFixedHeight(60)
-                self.layout.addWidget(block, row, col)
-        # enable mouse tracking to receive leaveEvent
-        self.setMouseTracking(True)
+            self.total_week_seconds += day_total
+            for p_idx, bucket in enumerate(buckets):
+                self._period_records[(current_date, p_idx)] = bucket
+            self._day_labels[col].seconds = day_total
+
+            for row in range(len(_PERIODS)):
+                cell = self._canvas.cell(row * 7 + col)
+                cell.date = current_date
+                cell.seconds = secs = period_seconds_map[row]
+                cell.level = self._get_level(secs, row)
+        self._canvas.update()
+        self.blockSignals(False)
+        self.setUpdatesEnabled(True)
+        self.update()
+
+    def get_records(self, d: date, period_idx: int) -> List[TimeRecord]:
+        """Records of the shown week that overlap one period of a day."""
+        return self._period_records.get((d, period_idx), [])
 
     def leaveEvent(self, event):
         self.hover_cleared.emit()
         super().leaveEvent(event)
 
-    def _get_color(self, seconds: int, period_idx: int) -> str:
-        # Light theme palette: gray for 0, green gradients for >0
-        if seconds == 0: return "#e5e7eb"  # light gray
-        hours = seconds / 3600.0
-        if hours < 0.5: return "#bbf7d0"  # green-200
-        if hours < 1.0: return "#86efac"  # green-300
-        if hours < 2.0: return "#4ade80"  # green-400
-        if hours < 3.0: return "#22c55e"  # green-500
-        if hours < 4.0: return "#16a34a"  # green-600
-        return "#15803d"                 # green-700
+    def _get_level(self, seconds: int, period_idx: int) -> int:
+        if seconds == 0:
+            return 0
+        return 1 + bisect_right(_WEEK_THRESHOLDS, seconds)
 
+    @Slot(str, int)
     def _on_block_hover(self, label: str, seconds: int):
-        formatted = self._fmt_time(seconds)
+        formatted = _fmt_time(seconds)
         self.hover_stats.emit(formatted, label)
-        
-    @staticmethod
-    def _fmt_time(seconds: int) -> str:
-        h = seconds // 3600
-        m = (seconds % 3600) // 60
-        return f"{h}h {m}m"
 
 
 class HoverLabel(QLabel):
     hovered = Signal(str, int)
-    clicked = Signal()
+    clicked = Signal(object, object) # date, None (whole day)
 
     def __init__(self, text, seconds, meta):
         super().__init__(text)
         self.seconds = seconds
         self.meta = meta
+        self.date: Optional[date] = None
         self.setAlignment(Qt.AlignCenter)
         self.setStyleSheet("color: #6b7280; padding: 5px;")
         self.setCursor(Qt.PointingHandCursor)
@@ -209,7 +398,7 @@ class HoverLabel(QLabel):
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            self.clicked.emit()
+            self.clicked.emit(self.date, None)
         super().mousePressEvent(event)
 
 class MonthGrid(QWidget):
@@ -222,66 +411,69 @@ class MonthGrid(QWidget):
         self.layout = QGridLayout(self)
         self.layout.setSpacing(4)
         self.layout.setContentsMargins(10, 10, 10, 10)
+        self.total_month_seconds = 0
 
-    def update_data(self, year: int, month: int, records_map: Dict[date, List[TimeRecord]]):
-        for i in reversed(range(self.layout.count())):
-            w = self.layout.itemAt(i).widget()
-            if w: w.setParent(None)
-
-        import calendar
-        cal = calendar.monthcalendar(year, month)
-        
-        days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        for i, d in enumerate(days):
+        for i, d in enumerate(_WEEKDAY_ABBR):
             l = QLabel(d)
             l.setAlignment(Qt.AlignCenter)
             l.setStyleSheet("color: #666;")
             self.layout.addWidget(l, 0, i)
-            
-        for r_idx, week in enumerate(cal):
-            for c_idx, day_num in enumerate(week):
-                if day_num == 0:
-                    continue
-                
-                d_date = date(year, month, day_num)
-                day_recs = records_map.get(d_date, [])
-                total_sec = sum(r.duration_sec for r in day_recs)
-                
-                color = self._get_color(total_sec)
-                
-                block = HeatmapBlock(f"{d_date.strftime('%b %d')}", total_sec, color)
-                block.setFixedSize(40, 40) 
-                block.hovered.connect(lambda l, s: self.hover_stats.emit(self._fmt_time(s), l))
-                block.clicked.connect(lambda d=d_date: self.request_records.emit(d))
-                
-                num_lbl = QLabel(str(day_num), block)
-                num_lbl.setStyleSheet("color: rgba(0,0,0,0.55); font-size: 10px; background: transparent;")
-                num_lbl.move(4, 2)
-                num_lbl.adjustSize()
-                num_lbl.setAttribute(Qt.WA_TransparentForMouseEvents) # Allow clicks to pass through
-                
-                self.layout.addWidget(block, r_idx + 1, c_idx)
+            self.layout.setColumnStretch(i, 1)
+
+        # Day cells are painted by one canvas, one row per calendar week;
+        # cells outside the month have no date and are skipped
+        self._canvas = HeatmapCanvas(0, 7, cell_height=40, cell_width=40)
+        self._canvas.hovered.connect(self._on_block_hover)
+        self._canvas.clicked.connect(self._on_block_clicked)
+        self.layout.addWidget(self._canvas, 1, 0, 1, 7)
         self.setMouseTracking(True)
 
+    def update_data(self, year: int, month: int, totals_map: Dict[date, int]):
+        # Batch all cell changes into a single repaint
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        cal = _month_cal(year, month)
+        self.total_month_seconds = 0
+        
+        self._canvas.set_rows(len(cal))
+        for idx in range(len(cal) * 7):
+            r_idx, c_idx = divmod(idx, 7)
+            day_num = cal[r_idx][c_idx]
+            cell = self._canvas.cell(idx)
+            if day_num == 0:
+                cell.date = None
+                continue
+            
+            d_date = date(year, month, day_num)
+            cell.date = d_date
+            total_sec = totals_map.get(d_date, 0)
+            self.total_month_seconds += total_sec
+            
+            cell.label = _fmt_short(d_date)
+            cell.seconds = total_sec
+            cell.level = self._get_level(total_sec)
+            cell.corner_text = str(day_num)
+        self._canvas.update()
+        self.blockSignals(False)
+        self.setUpdatesEnabled(True)
+        self.update()
+
     def leaveEvent(self, event):
         self.hover_cleared.emit()
         super().leaveEvent(event)
 
-    def _get_color(self, seconds: int) -> str:
-        # Light theme palette: gray for 0, green gradients for >0
-        if seconds == 0: return "#e5e7eb"  # gray-300
-        h = seconds / 3600.0
-        if h < 1: return "#bbf7d0"   # green-200
-        if h < 3: return "#86efac"   # green-300
-        if h < 5: return "#4ade80"   # green-400
-        if h < 7: return "#22c55e"   # green-500
-        return "#16a34a"             # green-600
+    def _get_level(self, seconds: int) -> int:
+        if seconds == 0:
+            return 0
+        return 1 + bisect_right(_MONTH_THRESHOLDS, seconds)
 
-    @staticmethod
-    def _fmt_time(seconds: int) -> str:
-        h = seconds // 3600
-        m = (seconds % 3600) // 60
-        return f"{h}h {m}m"
+    @Slot(str, int)
+    def _on_block_hover(self, label: str, seconds: int):
+        self.hover_stats.emit(_fmt_time(seconds), label)
+
+    @Slot(object, object)
+    def _on_block_clicked(self, d: date, period_idx: Optional[int]):
+        self.request_records.emit(d)
 
 
 class StatsView(QWidget):
@@ -296,14 +488,14 @@ class StatsView(QWidget):
         self._current_date = date.today()
         self._mode = "week" # or "month"
         self._last_month_total_sec: int = 0
+        # (mode, range, store revision) of what the grids currently show
+        self._last_refresh_key: Optional[tuple] = None
         
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(20, 20, 20, 20)
         self.layout.setSpacing(20)
 
         # --- Top Bar (Timer | Stats) ---
-        top_bar = QHBoxLayout()
-        
         self._btn_controls = QPushButton("Timer")
         self._btn_controls.setObjectName("TabButtonInactive")
         self._btn_controls.setCursor(Qt.PointingHandCursor)
@@ -395,18 +587,36 @@ class StatsView(QWidget):
         # --- Styling ---
         self._apply_styles()
 
+        # --- Hover throttle ---
+        # Sweeping the mouse over the grid fires one hover per block; apply the
+        # first one right away and then at most one update per frame (~60 Hz)
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(16)
+        self._hover_timer.timeout.connect(self._flush_hover)
+        self._hover_pending = False
+        # Latest hover text; None means restore the default totals
+        self._hover_text: Optional[Tuple[str, str]] = None
+
+        # Prev/Next only change the date; the redraw is debounced so that
+        # rapid clicks render the final range once
+        self._nav_timer = QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(80)
+        self._nav_timer.timeout.connect(self._refresh)
+
         # --- Events ---
         self._btn_prev.clicked.connect(self._on_prev)
         self._btn_next.clicked.connect(self._on_next)
         self._btn_week.clicked.connect(lambda: self._set_mode("week"))
         self._btn_month.clicked.connect(lambda: self._set_mode("month"))
         
-        self._week_view.hover_stats.connect(self._update_temp_stats)
-        self._week_view.hover_cleared.connect(self._restore_default_totals)
+        self._week_view.hover_stats.connect(self._on_hover_stats)
+        self._week_view.hover_cleared.connect(self._on_hover_cleared)
         self._week_view.request_records.connect(self._show_records_for_period)
         
-        self._month_view.hover_stats.connect(self._update_temp_stats)
-        self._month_view.hover_cleared.connect(self._restore_default_totals)
+        self._month_view.hover_stats.connect(self._on_hover_stats)
+        self._month_view.hover_cleared.connect(self._on_hover_cleared)
         self._month_view.request_records.connect(lambda d: self._show_records_for_period(d, None))
         
         # Initial Load
@@ -468,7 +678,7 @@ class StatsView(QWidget):
             }}
             
             /* Table Styles */
-            QTableWidget {{
+            QTableView {{
                 background-color: #ffffff;
                 color: #111111;
                 gridline-color: #e5e7eb;
@@ -480,15 +690,16 @@ class StatsView(QWidget):
                 padding: 4px;
                 border: 1px solid #e5e7eb;
             }}
-            QTableWidget::item {{
+            QTableView::item {{
                 padding: 4px;
             }}
-            QTableWidget::item:selected {{
+            QTableView::item:selected {{
                 background-color: #d1fae5;
             }}
         """)
         self._update_switcher_styles()
 
+    @Slot()
     def _on_prev(self):
         if self._mode == "week":
             self._current_date -= timedelta(days=7)
@@ -499,8 +710,9 @@ class StatsView(QWidget):
                 m = 12
                 y -= 1
             self._current_date = date(y, m, 1)
-        self._refresh()
+        self._nav_timer.start()
 
+    @Slot()
     def _on_next(self):
         if self._mode == "week":
             self._current_date += timedelta(days=7)
@@ -511,26 +723,42 @@ class StatsView(QWidget):
                 m = 1
                 y += 1
             self._current_date = date(y, m, 1)
-        self._refresh()
+        self._nav_timer.start()
 
     def _refresh(self):
+        if self._mode == "week":
+            range_key = self._current_date.toordinal() - self._current_date.weekday()
+        else:
+            range_key = (self._current_date.year, self._current_date.month)
+        key = (self._mode, range_key, self._store.revision)
+        if key == self._last_refresh_key:
+            # Same range, same data: the grids are already up to date
+            return
+        self._last_refresh_key = key
+        # Drop a coalesced hover so it cannot overwrite the fresh totals
+        self._hover_timer.stop()
+        self._hover_pending = False
         if self._mode == "week":
             self._load_week()
         else:
             self._load_month()
+        self._show_load_state()
+
+    def _show_load_state(self):
+        # Totals are partial until the workbook is in; say so in the subtitle
+        if self._store.load_error is not None:
+            self._lbl_total_sub.setText("Workbook not loaded")
+        elif not self._store.loaded:
+            # Store is still parsing the workbook in the background
+            self._lbl_total_sub.setText("Loading…")
 
     def _load_week(self):
-        monday = self._current_date - timedelta(days=self._current_date.weekday())
-        sunday = monday + timedelta(days=6)
-        m1 = monday.strftime("%b %d")
-        m2 = sunday.strftime("%b %d")
-        self._lbl_date_range.setText(f"{m1} - {m2}")
+        base_ord = self._current_date.toordinal() - self._current_date.weekday()
+        monday = date.fromordinal(base_ord)
+        # Range label built in one pass
+        self._lbl_date_range.setText(f"{_fmt_short(monday)} - {_fmt_short(date.fromordinal(base_ord + 6))}")
         
-        records_map = {}
-        for i in range(7):
-            d = monday + timedelta(days=i)
-            records_map[d] = self._store.get_records_for_date(d)
-            
+        records_map = self._store.get_records_for_week(monday)
         self._week_view.update_data(monday, records_map)
         self._lbl_total_sub.setText("Total This Week")
         self._show_default_total(self._week_view.total_week_seconds)
@@ -539,30 +767,53 @@ class StatsView(QWidget):
         y, m = self._current_date.year, self._current_date.month
         self._lbl_date_range.setText(self._current_date.strftime("%B %Y"))
         
-        import calendar
-        _, last_day = calendar.monthrange(y, m)
-        records_map = {}
-        total_sec = 0
-        for d_num in range(1, last_day + 1):
-            d = date(y, m, d_num)
-            recs = self._store.get_records_for_date(d)
-            records_map[d] = recs
-            total_sec += sum(r.duration_sec for r in recs)
-            
-        self._month_view.update_data(y, m, records_map)
+        # Only per-day totals are needed to draw; records are fetched on click
+        totals_map = self._store.get_daily_totals_for_month(y, m)
+        # MonthGrid adds up the daily totals while drawing; reuse its total
+        self._month_view.update_data(y, m, totals_map)
         self._lbl_total_sub.setText("Total This Month")
-        self._last_month_total_sec = total_sec
-        self._show_default_total(total_sec)
+        self._last_month_total_sec = self._month_view.total_month_seconds
+        self._show_default_total(self._last_month_total_sec)
+
+    @Slot(str, str)
+    def _on_hover_stats(self, main_text, sub_text):
+        self._queue_hover((main_text, sub_text))
+
+    @Slot()
+    def _on_hover_cleared(self):
+        self._queue_hover(None)
+
+    def _queue_hover(self, text: Optional[Tuple[str, str]]) -> None:
+        self._hover_text = text
+        if self._hover_timer.isActive():
+            self._hover_pending = True
+            return
+        # Leading edge: nothing shown recently, update immediately
+        self._apply_hover()
+        self._hover_timer.start()
+
+    @Slot()
+    def _flush_hover(self):
+        if self._hover_pending:
+            self._hover_pending = False
+            self._apply_hover()
+            self._hover_timer.start()
+
+    def _apply_hover(self) -> None:
+        if self._hover_text is None:
+            self._restore_default_totals()
+        else:
+            self._update_temp_stats(*self._hover_text)
 
+    @Slot(str, str)
     def _update_temp_stats(self, main_text, sub_text):
         self._lbl_total_val.setText(main_text)
         self._lbl_total_sub.setText(sub_text)
 
     def _show_default_total(self, seconds):
-        h = seconds // 3600
-        m = (seconds % 3600) // 60
-        self._lbl_total_val.setText(f"{h}h {m}m")
+        self._lbl_total_val.setText(_fmt_time(seconds))
 
+    @Slot()
     def _restore_default_totals(self):
         # Restore totals when hover leaves the grids
         if self._mode == "week":
@@ -571,39 +822,20 @@ class StatsView(QWidget):
         else:
             self._lbl_total_sub.setText("Total This Month")
             self._show_default_total(self._last_month_total_sec)
+        self._show_load_state()
 
+    @Slot(object, object)
     def _show_records_for_period(self, d: date, period_idx: Optional[int]):
-        records = self._store.get_records_for_date(d)
-        
         if period_idx is not None:
-            # Filter records that overlap with the period
-            # 0: 0-12, 1: 12-18, 2: 18-24
-            p_start_h = 0
-            p_end_h = 24
-            
-            if period_idx == 0:
-                p_start_h, p_end_h = 0, 12
-            elif period_idx == 1:
-                p_start_h, p_end_h = 12, 18
-            elif period_idx == 2:
-                p_start_h, p_end_h = 18, 24
-                
-            filtered = []
-            for r in records:
-                s = r.start_time.hour + r.start_time.minute/60.0
-                e = r.end_time.hour + r.end_time.minute/60.0
-                if e < s: e = 24.0 # Should not happen given assumed data constraints but safety check
-                
-                # Check overlap
-                overlap = max(0, min(e, p_end_h) - max(s, p_start_h))
-                if overlap > 0:
-                    filtered.append(r)
-            records = filtered
+            # Periods only exist in the week grid, which already bucketed
+            # the records while drawing
+            records = self._week_view.get_records(d, period_idx)
+        else:
+            records = self._store.get_records_for_date(d)
             
         title = f"Records for {d.strftime('%b %d, %Y')}"
         if period_idx is not None:
-            p_names = ["Morning", "Afternoon", "Evening"]
-            title += f" ({p_names[period_idx]})"
+            title += f" ({_PERIODS[period_idx][0]})"
             
         dlg = RecordListDialog(title, records, self)
         dlg.exec()
@@ -1,11 +1,217 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
+    QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, 
     QPushButton, QFrame, QSizePolicy
 )
-from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, Signal, Slot, QSize, QTimer, QEvent, QPointF
+from PySide6.QtGui import QColor, QCursor, QFont, QFontMetrics, QPainter, QPalette, QStaticText, QTransform
+
+
+# Light theme: background #F7F7F9, accent green #16a34a.
+# Built once at import; every TimerDisplay shares the same string.
+_STYLESHEET = """
+    QWidget {
+        background-color: #F7F7F9;
+        font-family: 'Segoe UI', sans-serif;
+    }
+    
+    /* Top Toggle */
+    QFrame#ToggleContainer {
+        background-color: #e5e7eb;
+        border-radius: 18px;
+    }
+    QPushButton#TabButtonActive {
+        background-color: #ffffff;
+        color: #111111;
+        border: none;
+        border-radius: 14px;
+        padding: 6px 16px;
+        font-weight: bold;
+        font-size: 13px;
+    }
+    QPushButton#TabButtonInactive {
+        background-color: transparent;
+        color: #6b7280;
+        border: none;
+        border-radius: 14px;
+        padding: 6px 16px;
+        font-weight: bold;
+        font-size: 13px;
+    }
+    QPushButton#TabButtonInactive:hover {
+        color: #111111;
+    }
+
+    /* Main Labels */
+    QLabel#StatusLabel {
+        color: #16a34a;
+        font-size: 16px;
+        font-weight: 600;
+        letter-spacing: 1px;
+        text-transform: uppercase;
+        background-color: transparent;
+    }
+    TimeLabel#TimeLabel {
+        color: #111111;
+        font-size: 96px;
+        font-weight: bold;
+        background-color: transparent;
+    }
+    
+    /* Action Button */
+    QPushButton#ActionButton {
+        background-color: #111111;
+        color: #ffffff;
+        border: none;
+        border-radius: 30px; /* Pill shape */
+        font-size: 18px;
+        font-weight: bold;
+        padding: 0 30px;
+    }
+    QPushButton#ActionButton:hover {
+        background-color: #0f172a;
+    }
+    QPushButton#ActionButton:pressed {
+        background-color: #1f2937;
+    }
+    
+    /* Stop Button */
+    QPushButton#StopButton {
+        background-color: transparent;
+        color: #6b7280;
+        border: none;
+        font-size: 14px;
+        font-weight: bold;
+        padding: 8px;
+        margin-top: 10px;
+    }
+    QPushButton#StopButton:hover {
+        color: #b91c1c;
+        text-decoration: underline;
+    }
+    QPushButton#ManualButton {
+        background-color: #e5e7eb;
+        color: #111111;
+        border: none;
+        border-radius: 10px;
+        font-size: 13px;
+        font-weight: 600;
+        padding: 8px 12px;
+        margin-top: 6px;
+    }
+    QPushButton#ManualButton:hover {
+        background-color: #d1d5db;
+    }
+"""
+
+
+@lru_cache(maxsize=1)
+def _hand_cursor() -> QCursor:
+    # Built on first use (after QApplication exists) and shared by all buttons
+    return QCursor(Qt.PointingHandCursor)
+
+
+class TimeLabel(QWidget):
+    """
+    Centered clock text drawn from cached QStaticText objects.
+
+    Font and color still come from the stylesheet (object name TimeLabel);
+    only the text layout is cached, so a tick costs a paint, not a relayout.
+    Prepared texts are kept per string, so repeated digits skip layout too.
+    """
+
+    _CACHE_SIZE = 256
+    # Size hint covers the widest regular clock text, so MM:SS <-> HH:MM:SS
+    # switches need no relayout
+    _WIDEST = "88:88:88"
+
+    def __init__(self, text: str = "", parent=None) -> None:
+        super().__init__(parent)
+        self._cache: OrderedDict[str, QStaticText] = OrderedDict()
+        self._current = self._static_text(text)
+        # Text colour is looked up when the palette changes, not on every paint
+        self._color: QColor = self.palette().color(QPalette.WindowText)
+        self._size_hint: Optional[QSize] = None
+        self._pos = QPointF()
+        self._update_pos()
+
+    def _static_text(self, text: str) -> QStaticText:
+        st = self._cache.get(text)
+        if st is not None:
+            self._cache.move_to_end(text)
+            return st
+        st = QStaticText(text)
+        st.setTextFormat(Qt.PlainText)
+        st.setPerformanceHint(QStaticText.AggressiveCaching)
+        st.prepare(QTransform(), self.font())
+        self._cache[text] = st
+        if len(self._cache) > self._CACHE_SIZE:
+            # Evict the least recently shown string
+            self._cache.popitem(last=False)
+        return st
+
+    def _update_pos(self) -> None:
+        # Top-left corner that centers the current text; kept out of paintEvent
+        size = self._current.size()
+        self._pos = QPointF((self.width() - size.width()) / 2, (self.height() - size.height()) / 2)
+
+    def text(self) -> str:
+        return self._current.text()
+
+    def setText(self, text: str) -> None:
+        old = self._current.text()
+        if text == old:
+            return
+        self._current = self._static_text(text)
+        self._update_pos()
+        widest = len(self._WIDEST)
+        if max(len(text), widest) != max(len(old), widest):
+            # Only 100+ hour texts outgrow the cached hint
+            self._size_hint = None
+            self.updateGeometry()
+        self.update()
+
+    def sizeHint(self) -> QSize:
+        if self._size_hint is None:
+            text = self._current.text()
+            sample = text if len(text) > len(self._WIDEST) else self._WIDEST
+            fm = QFontMetrics(self.font())
+            self._size_hint = QSize(fm.horizontalAdvance(sample), fm.height())
+        return self._size_hint
+
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.FontChange:
+            # Stylesheet font applied; texts prepared for the old font are stale
+            text = self._current.text()
+            self._cache.clear()
+            self._current = self._static_text(text)
+            self._size_hint = None
+            self._update_pos()
+            self.updateGeometry()
+        elif event.type() == QEvent.PaletteChange:
+            # Stylesheet colour rules arrive as palette changes
+            self._color = self.palette().color(QPalette.WindowText)
+        super().changeEvent(event)
+
+    def resizeEvent(self, event):
+        self._update_pos()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        # QPainter(self) already starts with the widget font
+        painter = QPainter(self)
+        painter.setPen(self._color)
+        painter.drawStaticText(self._pos, self._current)
+        painter.end()
+
 
 class TimerDisplay(QWidget):
     """
@@ -19,6 +225,12 @@ class TimerDisplay(QWidget):
     stats_requested = Signal()
     manual_requested = Signal()
 
+    # Per-state colour rules, applied only when the state actually changes
+    _STATUS_CSS_READY = "color: #16a34a;"  # Green (lighter theme)
+    _STATUS_CSS_PAUSED = "color: #b45309;"  # Amber-ish text
+    _TIME_CSS_NORMAL = "color: #111111;"
+    _TIME_CSS_DIM = "color: #6b7280;"
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         
@@ -26,18 +238,15 @@ class TimerDisplay(QWidget):
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(20, 20, 20, 40)
         self.layout.setSpacing(20)
-        self.setMouseTracking(True)
         
         # --- Top Bar (Controls | Stats) ---
-        top_bar = QHBoxLayout()
-        
         self._btn_controls = QPushButton("Timer")
         self._btn_controls.setObjectName("TabButtonActive")
-        self._btn_controls.setCursor(Qt.PointingHandCursor)
+        self._btn_controls.setCursor(_hand_cursor())
         
         self._btn_stats = QPushButton("Stats")
         self._btn_stats.setObjectName("TabButtonInactive")
-        self._btn_stats.setCursor(Qt.PointingHandCursor)
+        self._btn_stats.setCursor(_hand_cursor())
         self._btn_stats.clicked.connect(self.stats_requested.emit)
 
         # Container for the toggle
@@ -49,15 +258,8 @@ class TimerDisplay(QWidget):
         toggle_layout.addWidget(self._btn_controls)
         toggle_layout.addWidget(self._btn_stats)
         
-        top_bar.addWidget(toggle_container)
-        top_bar.addStretch() 
-        
-        # Top Left aligned
-        top_align_layout = QHBoxLayout()
-        top_align_layout.addWidget(toggle_container)
-        top_align_layout.addStretch()
-        
-        self.layout.addLayout(top_align_layout)
+        # Top Left aligned; the alignment flag replaces a wrapper HBox + stretch
+        self.layout.addWidget(toggle_container, 0, Qt.AlignLeft)
         self.layout.addStretch(1)
         
         # --- Center Content ---
@@ -68,9 +270,8 @@ class TimerDisplay(QWidget):
         self._status_label.setObjectName("StatusLabel")
         self._status_label.setAlignment(Qt.AlignCenter)
         
-        self._time_label = QLabel("00:00:00")
+        self._time_label = TimeLabel("00:00:00")
         self._time_label.setObjectName("TimeLabel")
-        self._time_label.setAlignment(Qt.AlignCenter)
         
         center_layout.addWidget(self._status_label)
         center_layout.addWidget(self._time_label)
@@ -81,30 +282,38 @@ class TimerDisplay(QWidget):
         # --- Bottom Button ---
         self._action_btn = QPushButton("Start Focus")
         self._action_btn.setObjectName("ActionButton")
-        self._action_btn.setCursor(Qt.PointingHandCursor)
+        self._action_btn.setCursor(_hand_cursor())
         self._action_btn.setFixedHeight(60)
-        self._action_btn.clicked.connect(self._on_action_clicked)
+        # Forwarded straight to start_requested/pause_requested; the target is
+        # swapped in set_running_state so clicks never enter Python
+        self._action_btn.clicked.connect(self.start_requested)
+        self._action_pauses = False
         
         # Stop Button (Initially hidden)
         self._stop_btn = QPushButton("Record")
         self._stop_btn.setObjectName("StopButton")
-        self._stop_btn.setCursor(Qt.PointingHandCursor)
+        self._stop_btn.setCursor(_hand_cursor())
         self._stop_btn.clicked.connect(self.stop_requested.emit)
         self._stop_btn.setVisible(False)
 
         self._manual_btn = QPushButton("Add Manual")
         self._manual_btn.setObjectName("ManualButton")
-        self._manual_btn.setCursor(Qt.PointingHandCursor)
+        self._manual_btn.setCursor(_hand_cursor())
         self._manual_btn.clicked.connect(self.manual_requested.emit)
 
         # Container to center the button and limit width
-        btn_container = QVBoxLayout()
+        btn_container = QGridLayout()
         btn_container.setAlignment(Qt.AlignCenter)
         
         self._action_btn.setMinimumWidth(200)
-        btn_container.addWidget(self._action_btn)
-        btn_container.addWidget(self._stop_btn)
-        btn_container.addWidget(self._manual_btn)
+        btn_container.addWidget(self._action_btn, 0, 0)
+        # Record and Add Manual take turns in one shared cell; both keep their
+        # size while hidden, so swapping them moves nothing on screen
+        for btn in (self._stop_btn, self._manual_btn):
+            policy = btn.sizePolicy()
+            policy.setRetainSizeWhenHidden(True)
+            btn.setSizePolicy(policy)
+            btn_container.addWidget(btn, 1, 0, Qt.AlignTop)
         
         self.layout.addLayout(btn_container)
 
@@ -114,151 +323,89 @@ class TimerDisplay(QWidget):
         # Internal state
         self._is_running = False
         self._is_paused = False
+        self._last_state: Optional[Tuple[bool, bool]] = None
 
-    def _on_action_clicked(self):
-        if self._is_running:
-            # If running, we pause
-            self.pause_requested.emit()
-        elif self._is_paused:
-            # When paused, the same button resumes via pause handler
-            self.pause_requested.emit()
-        else:
-            self.start_requested.emit()
+        # Leading-edge throttle: a new text is shown at once, and anything
+        # arriving within the next 100 ms is coalesced into one trailing repaint
+        self._shown_text = "00:00:00"
+        self._pending_text = self._shown_text
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(100)
+        self._flush_timer.timeout.connect(self._flush_time)
 
     def update_time(self, formatted: str) -> None:
-        parts = formatted.split(':')
-        if len(parts) == 3:
-            if parts[0] == "00":
-                # Show MM:SS
-                text = f"{parts[1]}:{parts[2].split('.')[0]}"
-            else:
-                text = formatted.split('.')[0]
+        # "HH:MM:SS" or "HH:MM:SS.t" -- address the fields by offset
+        if len(formatted) >= 8 and formatted[2] == ":":
+            # Show MM:SS while under an hour
+            text = formatted[3:8] if formatted[:2] == "00" else formatted[:8]
         else:
-            text = formatted
-            
-        self._time_label.setText(text)
+            # 100+ hours widen the hour field
+            text = formatted.partition('.')[0]
+
+        if text == self._pending_text:
+            # Same visible digits (e.g. a tenths-only change); nothing to do
+            return
+        self._pending_text = text
+        if self._flush_timer.isActive():
+            # Shown something moments ago; the trailing flush picks this up
+            return
+        self._show_time()
+        self._flush_timer.start()
+
+    @Slot()
+    def _flush_time(self) -> None:
+        if self._pending_text != self._shown_text:
+            self._show_time()
+            self._flush_timer.start()
+
+    def _show_time(self) -> None:
+        self._shown_text = self._pending_text
+        self._time_label.setText(self._shown_text)
 
     def set_running_state(self, is_running: bool, is_paused: bool):
+        state = (is_running, is_paused)
+        if state == self._last_state:
+            # Every setStyleSheet reparses; nothing to redo for the same state
+            return
+        self._last_state = state
         self._is_running = is_running
         self._is_paused = is_paused
+        # Running or paused: the action button pauses/resumes; otherwise it starts
+        pauses = is_running or is_paused
+        if pauses != self._action_pauses:
+            self._action_pauses = pauses
+            if pauses:
+                self._action_btn.clicked.disconnect(self.start_requested)
+                self._action_btn.clicked.connect(self.pause_requested)
+            else:
+                self._action_btn.clicked.disconnect(self.pause_requested)
+                self._action_btn.clicked.connect(self.start_requested)
+        # Batch the label/button changes into a single repaint
+        self.setUpdatesEnabled(False)
         if is_running:
             self._status_label.setText("Focusing...")
-            self._status_label.setStyleSheet("color: #16a34a;") # Green (lighter theme)
+            self._status_label.setStyleSheet(self._STATUS_CSS_READY)
             self._action_btn.setText("Pause")
-            self._time_label.setStyleSheet("color: #111111;")
+            self._time_label.setStyleSheet(self._TIME_CSS_NORMAL)
             self._stop_btn.setVisible(True)
             self._manual_btn.setVisible(False)
         elif is_paused:
             self._status_label.setText("Paused")
-            self._status_label.setStyleSheet("color: #b45309;") # Amber-ish text
+            self._status_label.setStyleSheet(self._STATUS_CSS_PAUSED)
             self._action_btn.setText("Resume")
-            self._time_label.setStyleSheet("color: #6b7280;")
+            self._time_label.setStyleSheet(self._TIME_CSS_DIM)
             self._stop_btn.setVisible(True)
             self._manual_btn.setVisible(False)
         else:
             self._status_label.setText("Ready to Flow")
-            self._status_label.setStyleSheet("color: #16a34a;")
+            self._status_label.setStyleSheet(self._STATUS_CSS_READY)
             self._action_btn.setText("Start")
-            self._time_label.setStyleSheet("color: #111111;")
+            self._time_label.setStyleSheet(self._TIME_CSS_NORMAL)
             self._stop_btn.setVisible(False)
             self._manual_btn.setVisible(True)
+        self.setUpdatesEnabled(True)
+        self.update()
 
     def _apply_styles(self):
-        # Light theme colors
-        bg_color = "#F7F7F9"
-        accent_green = "#16a34a"
-        
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {bg_color};
-                font-family: 'Segoe UI', sans-serif;
-            }}
-            
-            /* Top Toggle */
-            QFrame#ToggleContainer {{
-                background-color: #e5e7eb;
-                border-radius: 18px;
-            }}
-            QPushButton#TabButtonActive {{
-                background-color: #ffffff;
-                color: #111111;
-                border: none;
-                border-radius: 14px;
-                padding: 6px 16px;
-                font-weight: bold;
-                font-size: 13px;
-            }}
-            QPushButton#TabButtonInactive {{
-                background-color: transparent;
-                color: #6b7280;
-                border: none;
-                border-radius: 14px;
-                padding: 6px 16px;
-                font-weight: bold;
-                font-size: 13px;
-            }}
-            QPushButton#TabButtonInactive:hover {{
-                color: #111111;
-            }}
-
-            /* Main Labels */
-            QLabel#StatusLabel {{
-                color: {accent_green};
-                font-size: 16px;
-                font-weight: 600;
-                letter-spacing: 1px;
-                text-transform: uppercase;
-                background-color: transparent;
-            }}
-            QLabel#TimeLabel {{
-                color: #111111;
-                font-size: 96px;
-                font-weight: bold;
-                background-color: transparent;
-            }}
-            
-            /* Action Button */
-            QPushButton#ActionButton {{
-                background-color: #111111;
-                color: #ffffff;
-                border: none;
-                border-radius: 30px; /* Pill shape */
-                font-size: 18px;
-                font-weight: bold;
-                padding: 0 30px;
-            }}
-            QPushButton#ActionButton:hover {{
-                background-color: #0f172a;
-            }}
-            QPushButton#ActionButton:pressed {{
-                background-color: #1f2937;
-            }}
-            
-            /* Stop Button */
-            QPushButton#StopButton {{
-                background-color: transparent;
-                color: #6b7280;
-                border: none;
-                font-size: 14px;
-                font-weight: bold;
-                padding: 8px;
-                margin-top: 10px;
-            }}
-            QPushButton#StopButton:hover {{
-                color: #b91c1c;
-                text-decoration: underline;
-            }}
-            QPushButton#ManualButton {{
-                background-color: #e5e7eb;
-                color: #111111;
-                border: none;
-                border-radius: 10px;
-                font-size: 13px;
-                font-weight: 600;
-                padding: 8px 12px;
-                margin-top: 6px;
-            }}
-            QPushButton#ManualButton:hover {{
-                background-color: #d1d5db;
-            }}
-        """)
+        self.setStyleSheet(_STYLESHEET)